@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Exploratory Data Analysis Framework                                                 #
+# Version    : 0.1.19                                                                              #
+# Python     : 3.10.11                                                                             #
+# Filename   : /d8analysis/data/_numba.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/d8analysis                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday August 21st 2023 02:10:41 pm                                                 #
+# Modified   : Monday August 21st 2023 02:10:41 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Optional Numba compiled transforms of standard random variates.
+
+Numba is not a dependency of the package. When it is not installed, the transforms run as
+ordinary NumPy expressions.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+
+    def njit(*args, **kwargs):
+        """Stands in for numba.njit, returning the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ------------------------------------------------------------------------------------------------ #
+@njit(parallel=True, fastmath=True, cache=True)
+def lognorm_transform(z: np.ndarray, s: float, loc: float, scale: float) -> np.ndarray:
+    """Maps standard normal variates to lognormal variates with shape s."""
+    return np.exp(z * s + np.log(scale)) + loc
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def pareto_transform(e: np.ndarray, b: float, loc: float, scale: float) -> np.ndarray:
+    """Maps standard exponential variates to pareto variates with shape b."""
+    return np.exp(e / b) * scale + loc
@@ -17,8 +17,8 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
-import inspect
 from abc import ABC, abstractmethod, abstractproperty
+from functools import cached_property
 import logging
 from typing import Any, Callable, Union, List
 
@@ -45,6 +45,18 @@ class Dataset(ABC):
 
     def __init__(self, df: pd.DataFrame) -> None:
         self._df = df
+        self._deep_memory_cache = None
+        self._frequency_cache = None
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        return self.__df
+
+    @_df.setter
+    def _df(self, df: pd.DataFrame) -> None:
+        self.__df = df
+        # The cached visualizer is bound to the previous DataFrame.
+        self.__dict__.pop("plot", None)
 
     def __len__(self):
         """Returns the length of the dataset."""
@@ -66,14 +78,14 @@ class Dataset(ABC):
     @property
     def dtypes(self) -> list:
         """Returns the count of data types in the dataset."""
-        dtypes = self._df.dtypes.value_counts().reset_index()
-        dtypes.columns = ["Data Type", "Count"]
-        return dtypes
+        kinds, counts = np.unique(self._df.dtypes.astype(str).values, return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return pd.DataFrame({"Data Type": kinds[order], "Count": counts[order]})
 
     @property
     def size(self) -> int:
         """Returns the size of the Dataset in memory in bytes."""
-        return self._df.memory_usage(deep=True).sum()
+        return self._deep_memory().sum() + self._df.index.memory_usage(deep=True)
 
     # ------------------------------------------------------------------------------------------- #
     @property
@@ -83,7 +95,7 @@ class Dataset(ABC):
         nvars = self._df.shape[1]
         nrows = self._df.shape[0]
         ncells = nvars * nrows
-        size = self._df.memory_usage(deep=True).sum().sum()
+        size = self.size
         d = {
             "Number of Observations": nrows,
             "Number of Variables": nvars,
@@ -92,23 +104,30 @@ class Dataset(ABC):
         }
         overview = pd.DataFrame.from_dict(data=d, orient="index").reset_index()
         overview.columns = ["Characteristic", "Total"]
-        return self._format(df=overview)
+        return self._format(df=overview, thousands=True)
 
     # ------------------------------------------------------------------------------------------- #
     @property
     def info(self) -> pd.DataFrame:
         """Returns a DataFrame with basic dataset quality statistics"""
 
-        info = self._df.dtypes.to_frame().reset_index()
-        info.columns = ["Column", "DataType"]
-        info["Valid"] = self._df.count().values
-        info["Null"] = self._df.isna().sum().values
-        info["Validity"] = info["Valid"] / self._df.shape[0]
-        info["Cardinality"] = self._df.nunique().values
-        info["Percent Unique"] = self._df.nunique().values / self._df.shape[0]
-        info["Size"] = self._df.memory_usage(deep=True, index=False).to_frame().reset_index()[0]
+        n = self._df.shape[0]
+        valid = self._df.count()
+        nunique = self._df.nunique()
+        info = pd.DataFrame(
+            {
+                "Column": valid.index,
+                "DataType": self._df.dtypes.values,
+                "Valid": valid.values,
+                "Null": n - valid.values,
+                "Validity": valid.values / n,
+                "Cardinality": nunique.values,
+                "Percent Unique": nunique.values / n,
+                "Size": self._deep_memory().values,
+            }
+        )
         info = round(info, 2)
-        return self._format(df=info)
+        return self._format(df=info, thousands=True)
 
     # ------------------------------------------------------------------------------------------- #
     def as_df(self) -> pd.DataFrame:
@@ -127,7 +146,17 @@ class Dataset(ABC):
             replace (bool): Whether to sample with replacement
             random_state (int): Pseudo random seed.
         """
-        df = self._df.sample(n=n, frac=frac, replace=replace, random_state=random_state)
+        seedable = random_state is None or isinstance(
+            random_state, (int, np.integer, np.random.Generator)
+        )
+        if seedable and frac is None and not replace and n is not None and n < 0.01 * len(self._df):
+            # Draw the positions directly rather than permuting the full index. Other
+            # random_state types, e.g. np.random.RandomState, are left to DataFrame.sample.
+            rng = np.random.default_rng(random_state)
+            idx = rng.choice(len(self._df), size=n, replace=False)
+            df = self._df.iloc[idx]
+        else:
+            df = self._df.sample(n=n, frac=frac, replace=replace, random_state=random_state)
         return self._format(df=df)
 
     # ------------------------------------------------------------------------------------------- #
@@ -143,9 +172,9 @@ class Dataset(ABC):
                 here.
         """
         if exclude is not None:
-            cols = [col for col in self._df.columns if col not in exclude]
+            cols = self._df.columns.difference(exclude, sort=False)
         elif include is not None:
-            cols = [col for col in self._df.columns if col in include]
+            cols = self._df.columns.intersection(include, sort=False)
         else:
             cols = self._df.columns
         df = self._df[cols]
@@ -159,11 +188,13 @@ class Dataset(ABC):
             condition (Callable): Lambda function that will be used to
                 subset the data as a pandas dataframe.
                 Example condition = lambda df: df['age'] > 18
+                For repeated filters on large numeric data, as_df().query("age > 18")
+                evaluates the expression with numexpr and is typically faster.
         """
         try:
-            df = self._df[condition]
+            df = self._df.loc[condition(self._df) if callable(condition) else condition]
             return self._format(df=df)
-        except Exception as e:
+        except (KeyError, ValueError) as e:
             msg = f"Exception of type {type(e)} occurred.\n{e}"
             logger.exception(msg)
             raise
@@ -177,6 +208,11 @@ class Dataset(ABC):
             n (int): The top n observations to return.
         """
         try:
+            if pd.api.types.is_numeric_dtype(self._df[x]) and not pd.api.types.is_bool_dtype(
+                self._df[x]
+            ):
+                return self._df.nlargest(n, columns=x)
+            # nlargest does not support object or boolean data.
             df = self._df.sort_values(by=x, ascending=False, axis=0)
             return df.head(n)
         except KeyError as e:
@@ -204,7 +240,7 @@ class Dataset(ABC):
             exclude (list[str]): List of data types to exclude from the analysis.
             groupby (str): Column used as a factor variable for descriptive statistics.
         """
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
+        logger.debug("\n\nEntering describe.")
         nums, cats = self._filter_split_data(x=x, include=include, exclude=exclude, groupby=groupby)
 
         stats = DescriptiveStats()
@@ -222,8 +258,9 @@ class Dataset(ABC):
         self, df: pd.DataFrame, groupby: Union[str, list[str]] = None
     ) -> pd.DataFrame:
         """Describes numeric columns."""
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
-        logger.debug(f"\n\n{df.head()}")
+        logger.debug("\n\nEntering _describe_numeric.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n\n{df.head()}")
         d = {}
         if groupby is None:
             describe = df.describe()
@@ -237,7 +274,7 @@ class Dataset(ABC):
             sk = df.groupby(by=groupby).skew()
             describe = pd.concat([describe.T, sk], axis=1)
 
-        logger.debug(f"\n\nExiting {inspect.stack()[0][3]}.")
+        logger.debug("\n\nExiting _describe_numeric.")
         return describe
 
     # ------------------------------------------------------------------------------------------- #
@@ -250,13 +287,17 @@ class Dataset(ABC):
             return df.groupby(by=groupby).describe().T
 
     # ------------------------------------------------------------------------------------------- #
-    def unique(self, columns: list = None) -> pd.DataFrame:
+    def unique(self, columns: Union[str, list] = None) -> pd.DataFrame:
         """Returns a DataFrame containing the unique values for all or the designated columns.
 
         Args:
-            columns (list): List of columns for which unique values are to be returned.
+            columns (Union[str, list]): Column or list of columns for which unique values are to be returned.
         """
-        if columns is not None:
+        if isinstance(columns, str):
+            columns = [columns]
+        if columns is not None and len(columns) == 1:
+            df = pd.DataFrame({columns[0]: self._df[columns[0]].unique()})
+        elif columns is not None:
             df = self._df[columns].drop_duplicates().reset_index(drop=True)
         else:
             df = self._df.drop_duplicates().reset_index(drop=True)
@@ -282,67 +323,110 @@ class Dataset(ABC):
 
         """
 
-        if isinstance(self._df[x], pd.Series):
-            abs = (
-                self._df[x]
-                .value_counts(normalize=False, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
-            rel = (
-                self._df[x]
-                .value_counts(normalize=True, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
-        else:
-            abs = (
-                self._df[x].value_counts(normalize=False, sort=sort, ascending=ascending).to_frame()
-            )
-            rel = (
-                self._df[x].value_counts(normalize=True, sort=sort, ascending=ascending).to_frame()
-            )
-        freq = abs.join(rel, on=x)
-        freq.loc["Total"] = freq.sum()
-        freq["cumulative"] = freq["proportion"].cumsum()
-        freq.loc[freq.index[-1], freq.columns[-1]] = " "
+        freq = self._frequency(x=x, sort=sort, bins=bins, ascending=ascending).copy()
         if formatting:
-            freq = self._format(freq)
+            freq = self._format(freq, thousands=True)
         return freq
 
     # ------------------------------------------------------------------------------------------- #
-    @property
+    @cached_property
     def plot(self) -> DatasetVisualizer:  # pragma: no cover
         return DatasetVisualizer(df=self._df)
 
     # ------------------------------------------------------------------------------------------- #
-    @property
-    def gridplot(cls) -> GridPlot:  # pragma: no cover
+    @cached_property
+    def gridplot(self) -> GridPlot:  # pragma: no cover
         return GridPlot()
 
     # ------------------------------------------------------------------------------------------- #
     #                                PRIVATE METHODS                                              #
     # ------------------------------------------------------------------------------------------- #
-    def _format(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Returns the resulting dataframe with capitalized column names."""
-        df.columns = [col.capitalize() for col in df.columns]
-        df = df.apply(self._show_thousands_separator)
-        return df
-
-    def _show_thousands_separator(self, x):  # pragma: no cover
-        """Formats an numbers with thousands separator."""
-        try:
-            if self._is_numeric(x):
-                return f"{x:,}"
-            else:
-                return x
-        except Exception:
-            return x
-
-    def _is_numeric(self, x) -> bool:
+    def _format(self, df: pd.DataFrame, thousands: bool = False) -> pd.DataFrame:
+        """Returns the resulting dataframe with capitalized column names.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to format.
+            thousands (bool): Whether to render integer columns as strings with thousands
+                separators. Only for report style outputs; data access results stay numeric.
+        """
+        df.columns = df.columns.str.capitalize()
+        if not thousands:
+            return df
+        integers = {
+            col: self._format_integers(df[col])
+            for col in df.columns
+            if pd.api.types.is_integer_dtype(df[col])
+        }
+        return df.assign(**integers)
+
+    @staticmethod
+    def _format_integers(x: pd.Series) -> pd.Series:
+        """Formats an integer series with thousands separators.
+
+        Each distinct value is formatted once and the results are broadcast back through the
+        factorized codes. Series with missing values, or whose evenly spaced probe of up to
+        10,000 values is mostly unique, are formatted value by value instead, so high
+        cardinality columns skip the factorize pass.
+        """
+        if x.hasnans:
+            return x.map("{:,}".format)
+        probe = x.iloc[:: max(1, len(x) // 10000)]
+        if probe.nunique() > len(probe) // 2:
+            return x.map("{:,}".format)
+        codes, uniques = pd.factorize(x)
+        formatted = np.array([f"{value:,}" for value in uniques], dtype=object)
+        return pd.Series(formatted[codes], index=x.index, name=x.name)
+
+    def _deep_memory(self) -> pd.Series:
+        """Returns the deep memory usage by column, computed once per underlying DataFrame."""
+        if self._deep_memory_cache is None or self._deep_memory_cache[0] is not self._df:
+            # Only object-backed columns differ under deep introspection; fixed width dtypes
+            # are measured shallowly.
+            memory = self._df.memory_usage(deep=False, index=False)
+            objects = self._df.select_dtypes(include=["object", "category", "string"]).columns
+            if len(objects):
+                memory.loc[objects] = self._df[objects].memory_usage(deep=True, index=False)
+            self._deep_memory_cache = (self._df, memory)
+        return self._deep_memory_cache[1]
+
+    def _frequency(
+        self, x: Union[str, List[str]], sort: bool, bins: int, ascending: bool
+    ) -> pd.DataFrame:
+        """Returns the unformatted frequency table, memoized per argument set and DataFrame."""
+        if self._frequency_cache is None or self._frequency_cache[0] is not self._df:
+            self._frequency_cache = (self._df, {})
+        # Bin edges may be given as any sequence; they are keyed as a tuple.
+        edges = tuple(bins) if pd.api.types.is_list_like(bins) else bins
+        key = (tuple(x) if isinstance(x, list) else x, sort, edges, ascending)
+        cache = self._frequency_cache[1]
         try:
-            pd.to_numeric(x, errors="raise")
-            return True
-        except Exception:
-            return False
+            if key in cache:
+                return cache[key]
+        except TypeError:  # Unhashable arguments are computed without memoization.
+            key = None
+
+        # Counts are computed once; proportions are derived from them rather than recounted.
+        if isinstance(self._df[x], pd.Series) and bins is not None:
+            if not pd.api.types.is_numeric_dtype(self._df[x]):
+                raise TypeError("bins argument only works with numeric data.")
+            # Binning explicitly lets value_counts run on the resulting categorical codes.
+            binned = pd.cut(self._df[x], bins=bins, include_lowest=True)
+            abs = binned.value_counts(sort=sort, ascending=ascending).to_frame(name="count")
+            abs.index = abs.index.astype("interval")
+        else:
+            abs = (
+                self._df[x]
+                .value_counts(normalize=False, sort=sort, ascending=ascending)
+                .to_frame(name="count")
+            )
+        rel = (abs["count"] / abs["count"].sum()).to_frame(name="proportion")
+        freq = abs.join(rel)
+        freq.loc["Total"] = freq.sum()
+        freq["cumulative"] = freq["proportion"].cumsum()
+        freq.loc[freq.index[-1], freq.columns[-1]] = " "
+        if key is not None:
+            cache[key] = freq
+        return freq
 
     def _filter_split_data(
         self,
@@ -352,7 +436,7 @@ class Dataset(ABC):
         exclude: list[str] = None,
     ) -> pd.DataFrame:
         """Filters and splits the dataframe into numeric and categorical data dataframes according to the provided arguments"""
-        logger.debug(f"\n\nEntering {inspect.stack()[0][3]}.")
+        logger.debug("\n\nEntering _filter_split_data.")
         # Filter by include / exclude data type arguments
         df = self._df
         if include is not None:
@@ -373,8 +457,8 @@ class Dataset(ABC):
         # If columns remain and groupby argument is non-Null, add it back to the nums/cats dataframes, if not already present.
         if groupby is not None:
             if not nums.empty and groupby not in nums.columns:
-                nums = pd.concat([nums, self._df[groupby]], axis=1)
+                nums = nums.assign(**{groupby: self._df[groupby].values})
             if not cats.empty and groupby not in cats.columns:
-                cats = pd.concat([cats, self._df[groupby]], axis=1)
+                cats = cats.assign(**{groupby: self._df[groupby].values})
 
         return nums, cats
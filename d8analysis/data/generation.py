@@ -18,21 +18,28 @@
 # ================================================================================================ #
 """Statistics Module"""
 from __future__ import annotations
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from dataclasses import dataclass
 
-from scipy import stats
+from scipy import special, stats
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 from d8analysis.visual.seaborn.config import SeabornCanvas
 from d8analysis.data.dataclass import IMMUTABLE_TYPES
+from d8analysis.data._numba import lognorm_transform, pareto_transform
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
 NUM_POINTS = 5000
+# Random variates are drawn from NumPy directly, bypassing scipy's rvs argument dispatch. This
+# unseeded Generator is the default; pass a seeded Generator (or RVSDistribution(random_state))
+# for reproducible draws.
+RNG = np.random.default_rng()
 # ------------------------------------------------------------------------------------------------ #
 sns.set_style(SeabornCanvas.style)
 
@@ -48,6 +55,7 @@ DISTRIBUTIONS = {
     "gamma": stats.gamma,
     "logistic": stats.logistic,
     "lognorm": stats.lognorm,
+    "pareto": stats.pareto,
     "uniform": stats.uniform,
     "weibull": stats.weibull_min,
 }
@@ -63,6 +71,7 @@ CDF = {
     "gamma": stats.gamma.cdf,
     "logistic": stats.logistic.cdf,
     "lognorm": stats.lognorm.cdf,
+    "pareto": stats.pareto.cdf,
     "uniform": stats.uniform.cdf,
     "weibull": stats.weibull_min.cdf,
 }
@@ -99,14 +108,126 @@ class Distribution:
         return s
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                 RANDOM VARIATE SAMPLERS                                          #
+# ------------------------------------------------------------------------------------------------ #
+def _beta_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws beta variates for fitted (a, b, loc, scale)."""
+    a, b, loc, scale = fitted
+    return rng.beta(a, b, size=size) * scale + loc
+
+
+def _norm_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws normal variates for fitted (loc, scale)."""
+    loc, scale = fitted
+    return rng.normal(loc, scale, size=size)
+
+
+def _chi2_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws chi-squared variates for fitted (df, loc, scale), with len(data) - 1 dof."""
+    _, loc, scale = fitted
+    return rng.chisquare(len(data) - 1, size=size) * scale + loc
+
+
+def _exponential_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws exponential variates for fitted (loc, scale)."""
+    loc, scale = fitted
+    return rng.exponential(scale, size=size) + loc
+
+
+def _f_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws F variates for fitted (dfn, dfd, loc, scale)."""
+    dfn, dfd, loc, scale = fitted
+    return rng.f(dfn, dfd, size=size) * scale + loc
+
+
+def _gamma_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws gamma variates for fitted (a, loc, scale)."""
+    a, loc, scale = fitted
+    return rng.gamma(a, scale, size=size) + loc
+
+
+def _logistic_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws logistic variates for fitted (loc, scale)."""
+    loc, scale = fitted
+    return rng.logistic(loc, scale, size=size)
+
+
+def _lognorm_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws lognormal variates for fitted (s, loc, scale)."""
+    s, loc, scale = fitted
+    return lognorm_transform(rng.standard_normal(size=size), s, loc, scale)
+
+
+def _pareto_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws pareto variates for fitted (b, loc, scale)."""
+    # exp(E / b) is standard pareto for E standard exponential.
+    b, loc, scale = fitted
+    return pareto_transform(rng.standard_exponential(size=size), b, loc, scale)
+
+
+def _uniform_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws uniform variates for fitted (loc, scale)."""
+    loc, scale = fitted
+    return rng.uniform(loc, loc + scale, size=size)
+
+
+def _weibull_rvs(
+    data: np.ndarray, fitted: tuple, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws weibull variates for fitted (c, loc, scale)."""
+    c, loc, scale = fitted
+    return rng.weibull(c, size=size) * scale + loc
+
+
+# Variate draws only, without the pdf and cdf the generators also evaluate.
+SAMPLERS = {
+    "beta": _beta_rvs,
+    "norm": _norm_rvs,
+    "X2": _chi2_rvs,
+    "exponential": _exponential_rvs,
+    "f": _f_rvs,
+    "gamma": _gamma_rvs,
+    "logistic": _logistic_rvs,
+    "lognorm": _lognorm_rvs,
+    "pareto": _pareto_rvs,
+    "uniform": _uniform_rvs,
+    "weibull": _weibull_rvs,
+}
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                   DATA GENERATORS                                                #
 # ------------------------------------------------------------------------------------------------ #
-def beta(data: np.ndarray, size: int = None) -> np.ndarray:
+def beta(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the beta distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
@@ -114,7 +235,8 @@ def beta(data: np.ndarray, size: int = None) -> np.ndarray:
         cdf: Data from the cumulative distribution function
     """
     # Estimate parameters
-    a, b, loc, scale = get_params(data=data, distribution="beta")
+    fitted = fitted or get_params(data=data, distribution="beta")
+    a, b, loc, scale = fitted
 
     name = "Beta Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
@@ -139,9 +261,10 @@ def beta(data: np.ndarray, size: int = None) -> np.ndarray:
     )
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.beta.rvs(a, b, loc=loc, scale=scale, size=size)
+    rvs = _beta_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -171,11 +294,15 @@ def beta(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def norm(data: np.ndarray, size: int = None) -> np.ndarray:
+def norm(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the normal distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
@@ -183,7 +310,8 @@ def norm(data: np.ndarray, size: int = None) -> np.ndarray:
         cdf: Data from the cumulative distribution function
     """
     # Estimate parameters
-    loc, scale = get_params(data=data, distribution="norm")
+    fitted = fitted or get_params(data=data, distribution="norm")
+    loc, scale = fitted
 
     name = "Normal Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
@@ -191,9 +319,10 @@ def norm(data: np.ndarray, size: int = None) -> np.ndarray:
     formula = r"$ f(x) = \frac{\exp(-x^2/2)}{\sqrt{2\pi}}$" + "\n" + r"For real number x"
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.norm.rvs(loc=loc, scale=scale, size=size)
+    rvs = _norm_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -223,18 +352,23 @@ def norm(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def chi2(data: np.ndarray, size: int = None) -> np.ndarray:
+def chi2(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the chi-squared distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    _, loc, scale = get_params(data=data, distribution="X2")
+    fitted = fitted or get_params(data=data, distribution="X2")
+    _, loc, scale = fitted
     df = len(data) - 1
     name = r"$\chi^2$ Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
@@ -246,9 +380,10 @@ def chi2(data: np.ndarray, size: int = None) -> np.ndarray:
     )
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.chi2.rvs(df=df, loc=loc, scale=scale, size=size)
+    rvs = _chi2_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name,
         label=r"$\chi^2$ Random Variate",
@@ -283,28 +418,33 @@ def chi2(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def exponential(data: np.ndarray, size: int = None) -> np.ndarray:
+def exponential(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the exponential distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    loc, scale = get_params(data=data, distribution="exponential")
-    rvs = stats.expon.rvs(loc=loc, scale=scale, size=size)
+    fitted = fitted or get_params(data=data, distribution="exponential")
+    loc, scale = fitted
     name = "Exponential Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = "\nloc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$f(x) = \exp(-x)$" + "\n" + r"for x >= 0"
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.expon.rvs(loc=loc, scale=scale, size=size)
+    rvs = _exponential_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -334,18 +474,23 @@ def exponential(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def f(data: np.ndarray, size: int = None) -> np.ndarray:
+def f(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the f distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    dfn, dfd, loc, scale = get_params(data=data, distribution="f")
+    fitted = fitted or get_params(data=data, distribution="f")
+    dfn, dfd, loc, scale = fitted
     name = "F Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = (
@@ -365,9 +510,10 @@ def f(data: np.ndarray, size: int = None) -> np.ndarray:
     )
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.f.rvs(dfn=dfn, dfd=dfd, loc=loc, scale=scale, size=size)
+    rvs = _f_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -403,18 +549,23 @@ def f(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def gamma(data: np.ndarray, size: int = None) -> np.ndarray:
+def gamma(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the gamma distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    a, loc, scale = get_params(data=data, distribution="gamma")
+    fitted = fitted or get_params(data=data, distribution="gamma")
+    a, loc, scale = fitted
     name = "Gamma Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = (
@@ -432,9 +583,10 @@ def gamma(data: np.ndarray, size: int = None) -> np.ndarray:
     )
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.gamma.rvs(a, loc=loc, scale=scale, size=size)
+    rvs = _gamma_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -464,27 +616,33 @@ def gamma(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def logistic(data: np.ndarray, size: int = None) -> np.ndarray:
+def logistic(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the logistic distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    loc, scale = get_params(data=data, distribution="logistic")
+    fitted = fitted or get_params(data=data, distribution="logistic")
+    loc, scale = fitted
     name = "Logistic Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$ f(x) = \frac{\exp(-x)}{(1+\exp(-x))^2}$"
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.logistic.rvs(loc=loc, scale=scale, size=size)
+    rvs = _logistic_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -514,18 +672,23 @@ def logistic(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def lognorm(data: np.ndarray, size: int = None) -> np.ndarray:
+def lognorm(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the log normal distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    s, loc, scale = get_params(data=data, distribution="lognorm")
+    fitted = fitted or get_params(data=data, distribution="lognorm")
+    s, loc, scale = fitted
     name = "Lognorm Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = (
@@ -543,9 +706,10 @@ def lognorm(data: np.ndarray, size: int = None) -> np.ndarray:
     )
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.lognorm.rvs(s, loc=loc, scale=scale, size=size)
+    rvs = _lognorm_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -575,27 +739,96 @@ def lognorm(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def uniform(data: np.ndarray, size: int = None) -> np.ndarray:
+def pareto(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generates random variates for the pareto distribution
+
+    Args:
+        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
+
+    Returns:
+        rvs: Random variate of the distribution
+        pdf: Data from the probability density function
+        cdf: Data from the cumulative distribution function
+    """
+    fitted = fitted or get_params(data=data, distribution="pareto")
+    b, loc, scale = fitted
+    name = "Pareto Distribution"
+    x_range = np.linspace(min(data), max(data), NUM_POINTS)
+    params = (
+        "b ="
+        + str(round(b, 2))
+        + "\nloc = "
+        + str(round(loc, 2))
+        + ", scale = "
+        + str(round(scale, 2))
+    )
+    formula = r"$f(x, b) = \frac{b}{x^{b+1}}$" + "\n" + r"For x >= 1, b > 0."
+
+    size = size or len(data)
+    rng = rng or RNG
+
+    # Random variate
+    rvs = _pareto_rvs(data=data, fitted=fitted, size=size, rng=rng)
+    rvs = Distribution(
+        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
+    )
+
+    # Probability density function
+    pdf = stats.pareto.pdf(x=x_range, b=b, loc=loc, scale=scale)
+    pdf = Distribution(
+        name=name,
+        label="Probability Density Function",
+        formula=formula,
+        params=params,
+        x=x_range,
+        y=pdf,
+    )
+
+    # Cumulative density function
+    cdf = stats.pareto.cdf(x=x_range, b=b, loc=loc, scale=scale)
+    cdf = Distribution(
+        name=name,
+        label="Cumulative Density Function",
+        params=params,
+        formula=formula,
+        x=x_range,
+        y=cdf,
+    )
+
+    return rvs, pdf, cdf
+
+
+def uniform(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the uniform distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    loc, scale = get_params(data=data, distribution="uniform")
+    fitted = fitted or get_params(data=data, distribution="uniform")
+    loc, scale = fitted
     name = "Uniform Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
     params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
     formula = r"$ f(x) = \frac{1}{(b-a)}$" + "for a <= x <= b"
 
     size = size or len(data)
+    rng = rng or RNG
 
     # Random variate
-    rvs = stats.uniform.rvs(loc=loc, scale=scale, size=size)
+    rvs = _uniform_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -625,18 +858,23 @@ def uniform(data: np.ndarray, size: int = None) -> np.ndarray:
     return rvs, pdf, cdf
 
 
-def weibull(data: np.ndarray, size: int = None) -> np.ndarray:
+def weibull(
+    data: np.ndarray, size: int = None, fitted: tuple = None, rng: np.random.Generator = None
+) -> np.ndarray:
     """Generates random variates for the uniform distribution
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        fitted (tuple): Previously fitted distribution parameters. Estimated from data if None.
+        rng (np.random.Generator): Source of the random variates. Defaults to the module Generator.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    c, loc, scale = get_params(data=data, distribution="weibull")
+    fitted = fitted or get_params(data=data, distribution="weibull")
+    c, loc, scale = fitted
 
     name = "Weibull Distribution"
     x_range = np.linspace(min(data), max(data), NUM_POINTS)
@@ -650,8 +888,9 @@ def weibull(data: np.ndarray, size: int = None) -> np.ndarray:
     )
     formula = r"$f(x, c) = c x^{c-1} \exp(-x^c)$" + "\n" + r"For x > 0, c > 0."
     size = size or len(data)
+    rng = rng or RNG
     # Random variate
-    rvs = stats.weibull_min.rvs(c, loc=loc, scale=scale, size=size)
+    rvs = _weibull_rvs(data=data, fitted=fitted, size=size, rng=rng)
     rvs = Distribution(
         name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
     )
@@ -682,7 +921,14 @@ def weibull(data: np.ndarray, size: int = None) -> np.ndarray:
 
 
 def get_params(data: np.ndarray, distribution: str) -> tuple:
-    """Obtains the distribution parameters estimated from the data."""
+    """Obtains the distribution parameters estimated from the data.
+
+    Distributions with closed form or directly solvable maximum likelihood estimates bypass
+    scipy's generic numerical fit.
+    """
+    estimator = CLOSED_FORM.get(distribution)
+    if estimator is not None:
+        return estimator(data, _summarize(data=data))
     try:
         return DISTRIBUTIONS[distribution].fit(data)
     except AttributeError as e:  # pragma: no cover
@@ -691,6 +937,112 @@ def get_params(data: np.ndarray, distribution: str) -> tuple:
         raise e
 
 
+def fit_all(data: np.ndarray, distributions: list = None) -> dict:
+    """Estimates the parameters of several distributions from a single pass of summary statistics.
+
+    Normal, uniform, exponential and logistic parameters are estimated as in get_params. Gamma and chi-squared
+    parameters are estimated by the method of moments, refined with one Newton step on the
+    shape parameter. All other distributions are fitted by maximum likelihood via get_params.
+
+    Args:
+        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        distributions (list): Names of distributions in DISTRIBUTIONS. Defaults to all.
+
+    Returns:
+        dict: Fitted parameter tuples keyed by distribution name.
+    """
+    distributions = distributions or list(DISTRIBUTIONS.keys())
+    summary = _summarize(data=data)
+    params = {}
+    for distribution in distributions:
+        estimator = ESTIMATORS.get(distribution)
+        estimate = estimator(data, summary) if estimator is not None else None
+        params[distribution] = estimate or get_params(data=data, distribution=distribution)
+    return params
+
+
+def _summarize(data: np.ndarray) -> dict:
+    """Computes the summary statistics shared by the closed form and moment estimators."""
+    mean = data.mean()
+    deviations = data - mean
+    m2 = np.mean(deviations**2)
+    m3 = np.mean(deviations**3)
+    return {
+        "mean": mean,
+        "std": np.sqrt(m2),
+        "skew": m3 / m2**1.5 if m2 > 0 else 0.0,
+        "min": data.min(),
+        "max": data.max(),
+    }
+
+
+def _gamma_moments(data: np.ndarray, summary: dict) -> tuple:
+    """Method of moments gamma estimate (a, loc, scale), refined by one Newton step on a."""
+    skew = summary["skew"]
+    if skew <= 0:
+        return None
+    a = 4 / skew**2
+    loc = summary["mean"] - 2 * summary["std"] / skew
+    # The location must lie below the sample minimum for the log-likelihood to be defined.
+    loc = min(loc, summary["min"] - 1e-8 * max(summary["max"] - summary["min"], 1.0))
+    shifted = data - loc
+    s = np.log(shifted.mean()) - np.log(shifted).mean()
+    step = (np.log(a) - special.digamma(a) - s) / (1 / a - special.polygamma(1, a))
+    if a - step > 0:
+        a -= step
+    return a, loc, shifted.mean() / a
+
+
+def _logistic_mle(data: np.ndarray, summary: dict, tol: float = 1e-10) -> tuple:
+    """Logistic maximum likelihood estimate (loc, scale) by Newton iteration on the score equations.
+
+    Seeded with the moment estimates loc = mean, scale = std * sqrt(3) / pi.
+    """
+    loc, scale = summary["mean"], summary["std"] * np.sqrt(3) / np.pi
+    if scale <= 0:
+        return loc, scale
+    n = len(data)
+    for _ in range(100):
+        z = (data - loc) / scale
+        t = np.tanh(z / 2)
+        dt = (1 - t * t) / 2
+        dz = t + z * dt
+        # Score equations: sum(t) = 0 and sum(z * t) = n, with Jacobian in (loc, scale).
+        f = np.array([t.sum(), (z * t).sum() - n])
+        jacobian = -np.array([[dt.sum(), (z * dt).sum()], [dz.sum(), (z * dz).sum()]]) / scale
+        step = np.linalg.solve(jacobian, -f)
+        loc += step[0]
+        scale = max(scale + step[1], scale / 2)
+        if np.all(np.abs(step) <= tol * max(scale, 1.0)):
+            break
+    return loc, scale
+
+
+def _chi2_moments(data: np.ndarray, summary: dict) -> tuple:
+    """Chi-squared estimate (df, loc, scale) from the equivalent gamma estimate."""
+    estimate = _gamma_moments(data=data, summary=summary)
+    if estimate is None:
+        return None
+    a, loc, scale = estimate
+    return 2 * a, loc, scale / 2
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 PARAMETER ESTIMATORS                                             #
+# ------------------------------------------------------------------------------------------------ #
+CLOSED_FORM = {
+    "norm": lambda data, summary: (summary["mean"], summary["std"]),
+    "uniform": lambda data, summary: (summary["min"], summary["max"] - summary["min"]),
+    "exponential": lambda data, summary: (summary["min"], summary["mean"] - summary["min"]),
+    "logistic": _logistic_mle,
+}
+ESTIMATORS = {
+    **CLOSED_FORM,
+    "gamma": _gamma_moments,
+    "X2": _chi2_moments,
+}
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                               DISTRIBUTION GENERATOR                                             #
 # ------------------------------------------------------------------------------------------------ #
@@ -706,6 +1058,7 @@ class RVSDistribution:
 
     Args:
         data (pd.DataFrame): Data from which distribution parameters are estimated.
+        random_state (int): Seed for the random variates. Draws are reproducible when provided.
     """
 
     __DISTRIBUTIONS = {
@@ -719,14 +1072,17 @@ class RVSDistribution:
         "lognorm": lognorm,
         "uniform": uniform,
         "weibull": weibull,
-        # "pareto": pareto,
+        "pareto": pareto,
     }
 
-    def __init__(self) -> None:
+    def __init__(self, random_state: int = None) -> None:
+        self._rng = np.random.default_rng(random_state)
         self._rvs = None
         self._pdf = None
         self._cdf = None
         self._distribution = None
+        self._fit_cache = {}
+        self._generators = self.__DISTRIBUTIONS
 
     @property
     def data(self) -> np.ndarray:
@@ -754,19 +1110,73 @@ class RVSDistribution:
             data (np.ndarray): The data from which the distribution parameters are estimated
             distribution (str): One of the supported distributions. See the README.
         """
+        data = np.asarray(data)
         self._data = data
         self._distribution = distribution
 
-        try:
-            self._rvs, self._pdf, self._cdf = self.__DISTRIBUTIONS[distribution](
-                data=data, size=size
-            )
-        except KeyError as e:  # pragma: no cover
-            msg = f"{distribution} is not supported.\n{e}"
+        generator = self._generators.get(distribution)
+        if generator is None:  # pragma: no cover
+            msg = f"{distribution} is not supported."
             logger.debug(msg)
             raise NotImplementedError(msg)
+        fitted = self._fit(data=data, distribution=distribution)
+        self._rvs, self._pdf, self._cdf = generator(
+            data=data, size=size, fitted=fitted, rng=self._rng
+        )
         return self
 
+    def rvs_many(
+        self, data: np.ndarray, distributions: list, size: int = None, max_workers: int = None
+    ) -> dict:
+        """Returns random values for several distributions estimated from the same data.
+
+        Parameters for every distribution are fitted in a single pass before any variates are
+        drawn, and only the variates are sampled; the pdf and cdf are not evaluated. Each
+        distribution draws from its own child of the instance Generator, so results for a given
+        random_state are the same whether or not a thread pool is used. The per-instance state
+        used by the plotting methods is left unchanged.
+
+        Args:
+            data (np.ndarray): The data from which the distribution parameters are estimated
+            distributions (list): Supported distributions. See the README.
+            size (int): Number of variates per distribution. Defaults to the length of data.
+            max_workers (int): If provided, variates are drawn concurrently on a thread pool of
+                this size. Independent child Generators let the draws run in parallel.
+
+        Returns:
+            dict mapping each distribution to its array of random variates.
+        """
+        data = np.asarray(data)
+        samplers = {name: SAMPLERS.get(name) for name in distributions}
+        unsupported = [name for name, sampler in samplers.items() if sampler is None]
+        if unsupported:  # pragma: no cover
+            msg = f"{', '.join(unsupported)} not supported."
+            logger.debug(msg)
+            raise NotImplementedError(msg)
+        fitted = {name: self._fit(data=data, distribution=name) for name in samplers}
+        rngs = dict(zip(samplers, self._rng.spawn(len(samplers))))
+        size = size or len(data)
+
+        def draw(name: str) -> np.ndarray:
+            return samplers[name](data=data, fitted=fitted[name], size=size, rng=rngs[name])
+
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(samplers, executor.map(draw, samplers)))
+        return {name: draw(name) for name in samplers}
+
+    def _fit(self, data: np.ndarray, distribution: str) -> tuple:
+        """Returns the distribution parameters for the data, fitting only on first request.
+
+        Fits are keyed by a digest of the data contents, so repeated calls with the same data
+        and distribution reuse the earlier estimate.
+        """
+        digest = hashlib.sha1(np.ascontiguousarray(data)).hexdigest()
+        key = (digest, data.shape, data.dtype.str, distribution)
+        if key not in self._fit_cache:
+            self._fit_cache[key] = get_params(data=data, distribution=distribution)
+        return self._fit_cache[key]
+
     def histplot(self, ax: plt.Axes = None) -> plt.Axes:  # pragma: no cover
         """Plots the distribution of the data as a histogram
 
@@ -17,7 +17,6 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
-import statistics
 from typing import Union
 
 import pandas as pd
@@ -39,11 +38,13 @@ class CategoricalStats(DescriptiveOne):
     @classmethod
     def describe(cls, x: Union[pd.Series, np.ndarray], name: str = None) -> None:
         name = name or cls.get_name(x=x)
+        # A single hashed count yields the non-null count, mode and cardinality.
+        counts = pd.Series(x).value_counts(dropna=True)
         return cls(
             name=name,
             length=len(x),
-            count=len(list(filter(None, x))),
+            count=int(counts.sum()),
             size=x.__sizeof__(),
-            mode=statistics.mode(x),
-            unique=len(np.unique(x)),
+            mode=counts.index[0],
+            unique=len(counts),
         )
@@ -17,9 +17,11 @@
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from dataclasses import dataclass
+from functools import lru_cache
+from math import exp, log, pi
 
 import numpy as np
-from scipy import stats
+from scipy import special, stats
 import seaborn as sns
 import matplotlib.pyplot as plt
 from dependency_injector.wiring import inject, Provide
@@ -35,6 +37,40 @@ from d8analysis.quantitative.inferential.base import (
 from d8analysis.quantitative.descriptive.continuous import ContinuousStats
 
 
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=128)
+def _t_pdf_coef(dof: float) -> float:
+    """Returns the normalizing constant of the Student's t density for dof degrees of freedom."""
+    return exp(special.gammaln((dof + 1) / 2) - special.gammaln(dof / 2) - 0.5 * log(dof * pi))
+
+
+def _t_pdf(x: np.ndarray, dof: float, out: np.ndarray = None) -> np.ndarray:
+    """Evaluates the Student's t density directly, bypassing scipy's distribution dispatch.
+
+    If out is provided, the density is computed in place in that array.
+    """
+    out = np.multiply(x, x, out=out)
+    np.divide(out, dof, out=out)
+    np.add(out, 1.0, out=out)
+    np.power(out, -(dof + 1) / 2, out=out)
+    np.multiply(out, _t_pdf_coef(dof), out=out)
+    return out
+
+
+@lru_cache(maxsize=32)
+def _t_distribution(dof: float, alpha: float) -> tuple:
+    """Returns the read-only density grid and critical values, shared by results with the same
+    dof and alpha."""
+    # The inverse CDF ufunc is called directly, skipping scipy's distribution dispatch.
+    x = np.linspace(special.stdtrit(dof, 0.001), special.stdtrit(dof, 0.999), 500)
+    y = _t_pdf(x, dof)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    lower_critical = special.stdtrit(dof, alpha / 2)
+    upper_critical = special.stdtrit(dof, 1 - (alpha / 2))
+    return x, y, lower_critical, upper_critical
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                     TEST RESULT                                                  #
 # ------------------------------------------------------------------------------------------------ #
@@ -51,25 +87,27 @@ class TTestResult(StatTestResult):
     def __post_init__(self, canvas: Canvas = Provide[D8AnalysisContainer.canvas.seaborn]) -> None:
         super().__post_init__(canvas=canvas)
         _, self._ax = self._canvas.get_figaxes()
+        # Reject region densities are written into these on each plot.
+        self._ylower = np.empty(200)
+        self._yupper = np.empty(200)
 
     def plot(self) -> None:  # pragma: no cover
         """Plots the test statistic and reject region"""
 
         # Render the probability distribution
-        x = np.linspace(stats.t.ppf(0.001, self.dof), stats.t.ppf(0.999, self.dof), 500)
-        y = stats.t.pdf(x, self.dof)
+        x, y, lower_critical, upper_critical = self._get_distribution()
+        self._x, self._y = x, y
         self._ax = sns.lineplot(x=x, y=y, markers=False, dashes=False, sort=True, ax=self._ax)
 
         # Compute reject region
         lower = x[0]
         upper = x[-1]
-        lower_alpha = self.alpha / 2
-        upper_alpha = 1 - (self.alpha / 2)
-        lower_critical = stats.t.ppf(lower_alpha, self.dof)
-        upper_critical = stats.t.ppf(upper_alpha, self.dof)
 
         self._fill_reject_region(
-            lower=lower, upper=upper, lower_critical=lower_critical, upper_critical=upper_critical
+            lower=lower,
+            upper=upper,
+            lower_critical=lower_critical,
+            upper_critical=upper_critical,
         )
 
         self._ax.set_title(
@@ -81,6 +119,10 @@ class TTestResult(StatTestResult):
         self._ax.set_ylabel("Probability Density")
         plt.tight_layout()
 
+    def _get_distribution(self) -> tuple:
+        """Returns the density grid and critical values for this result's dof and alpha."""
+        return _t_distribution(dof=round(self.dof, 3), alpha=round(self.alpha, 6))
+
     def _fill_reject_region(
         self,
         lower: float,
@@ -91,41 +133,33 @@ class TTestResult(StatTestResult):
         """Fills the area under the curve at the value of the hypothesis test statistic."""
 
         # Fill lower tail
-        xlower = np.arange(lower, lower_critical, 0.001)
+        xlower = np.linspace(lower, lower_critical, len(self._ylower))
+        ylower = _t_pdf(xlower, self.dof, out=self._ylower)
         self._ax.fill_between(
             x=xlower,
             y1=0,
-            y2=stats.t.pdf(xlower, self.dof),
+            y2=ylower,
             color=self._canvas.colors.orange,
         )
 
         # Fill Upper Tail
-        xupper = np.arange(upper_critical, upper, 0.001)
+        xupper = np.linspace(upper_critical, upper, len(self._yupper))
+        yupper = _t_pdf(xupper, self.dof, out=self._yupper)
         self._ax.fill_between(
             x=xupper,
             y1=0,
-            y2=stats.t.pdf(xupper, self.dof),
+            y2=yupper,
             color=self._canvas.colors.orange,
         )
 
-        # Plot the statistic
-        line = self._ax.lines[0]
-        xdata = line.get_xydata()[:, 0]
-        ydata = line.get_xydata()[:, 1]
+        # Plot the statistic at the first grid point beyond it on the plotted density.
         statistic = round(self.value, 4)
         try:
-            idx = np.where(xdata > self.value)[0][0]
-            x = xdata[idx]
-            y = ydata[idx]
-            _ = sns.regplot(
-                x=np.array([x]),
-                y=np.array([y]),
-                scatter=True,
-                fit_reg=False,
-                marker="o",
-                scatter_kws={"s": 100},
-                ax=self._ax,
-                color=self._canvas.colors.dark_blue,
+            idx = np.searchsorted(self._x, self.value, side="right")
+            x = self._x[idx]
+            y = self._y[idx]
+            self._ax.scatter(
+                [x], [y], s=100, color=self._canvas.colors.dark_blue, marker="o", zorder=5
             )
             ytext = 10
             if np.isclose(statistic, 0, atol=1e-1):
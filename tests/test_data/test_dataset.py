@@ -792,6 +792,49 @@ class TestDataset:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_frequency_cached(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        df = pd.DataFrame({"Income": [10000, 20000, 60000, 75000, 120000], "Own": list("YNYYN")})
+        ds = CreditScoreDataset(df=df)
+        bins = [0, 50000, 100000, 150000]
+        df = ds.frequency(x="Income", bins=bins)
+        assert len(df) == 4
+        assert ds.frequency(x="Income", bins=tuple(bins)).equals(df)
+        # Formatting the returned copy must not alter the memoized table.
+        cached = ds.frequency(x="Income", bins=bins, formatting=False)
+        assert "count" in cached.columns
+        assert cached is not ds.frequency(x="Income", bins=bins, formatting=False)
+        assert ds.frequency(x="Own", bins=None).equals(ds.frequency(x="Own", bins=None))
+        with pytest.raises(TypeError):
+            ds.frequency(x="Own")
+        logger.debug(f"\n{df}")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_histable(self, dataset, caplog):
         start = datetime.now()
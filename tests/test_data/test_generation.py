@@ -22,8 +22,9 @@ import pytest
 import logging
 
 import numpy as np
+from scipy import stats
 
-from d8analysis.data.generation import RVSDistribution, DISTRIBUTIONS, Distribution
+from d8analysis.data.generation import RVSDistribution, DISTRIBUTIONS, Distribution, fit_all
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -76,3 +77,125 @@ class TestRVSDistribution:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fit_all(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = np.random.default_rng(1).gamma(3, 2, size=2000) + 10
+        params = fit_all(data=data, distributions=["norm", "uniform", "exponential", "gamma"])
+        assert np.allclose(params["norm"], DISTRIBUTIONS["norm"].fit(data))
+        assert np.allclose(params["uniform"], DISTRIBUTIONS["uniform"].fit(data))
+        assert np.allclose(params["exponential"], DISTRIBUTIONS["exponential"].fit(data))
+        a, loc, scale = params["gamma"]
+        assert a > 0 and scale > 0
+        assert loc < data.min()
+        logger.debug(params)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_random_state(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = np.random.default_rng(1).gamma(3, 2, size=2000) + 10
+        for distribution in ["norm", "gamma", "lognorm", "pareto"]:
+            first = RVSDistribution(random_state=55)(data=data, distribution=distribution)
+            second = RVSDistribution(random_state=55)(data=data, distribution=distribution)
+            other = RVSDistribution(random_state=56)(data=data, distribution=distribution)
+            assert np.array_equal(first.rvs.y, second.rvs.y)
+            assert not np.array_equal(first.rvs.y, other.rvs.y)
+        logger.debug(first.rvs)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_rvs_many(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = np.random.default_rng(1).gamma(3, 2, size=2000) + 10
+        distributions = ["norm", "gamma", "lognorm", "pareto"]
+        serial = RVSDistribution(random_state=55).rvs_many(data=data, distributions=distributions)
+        threaded = RVSDistribution(random_state=55).rvs_many(
+            data=data, distributions=distributions, max_workers=4
+        )
+        assert list(serial) == list(threaded) == distributions
+        sized = RVSDistribution().rvs_many(data=data, distributions=distributions, size=500)
+        # Plain sequences are accepted as well as arrays.
+        assert len(RVSDistribution()(data=list(data), distribution="norm").rvs.y) == len(data)
+        for name in distributions:
+            assert len(serial[name]) == len(data)
+            assert len(sized[name]) == 500
+            assert np.array_equal(serial[name], threaded[name])
+            # Draws follow the distribution fitted to the data.
+            fitted = RVSDistribution()._fit(data=data, distribution=name)
+            assert stats.kstest(serial[name], DISTRIBUTIONS[name].cdf, args=fitted).pvalue > 0.001
+        logger.debug(serial)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)